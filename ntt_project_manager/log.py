@@ -1,9 +1,18 @@
+import io
+import os
+import sys
+import atexit
 import logging
+from typing import IO
 
 
 class ColorStreamHandler(logging.Handler):
     """
     A logging handler that outputs colored logs to the console.
+
+    Records are written into a buffered stderr wrapper instead of being
+    printed (and flushed) one by one; the buffer is only flushed for
+    WARNING and above, and once at interpreter exit.
     """
 
     COLOR_CODES = {
@@ -15,11 +24,60 @@ class ColorStreamHandler(logging.Handler):
     }
     RESET_CODE = "\033[0m"
 
-    def emit(self, record: logging.LogRecord) -> None:
-        color_code = self.COLOR_CODES.get(record.levelname, self.RESET_CODE)
-        message = self.format(record)
-        colored_message = f"{color_code}{message}{self.RESET_CODE}"
-        print(colored_message)
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+
+        # closefd=False keeps the real stderr alive when the wrapper is
+        # torn down at interpreter shutdown; when stderr has no real
+        # file descriptor (pytest capture, embedded interpreters, ...)
+        # fall back to writing through sys.stderr directly
+        self._buffer: IO[str]
+
+        try:
+            self._buffer = io.TextIOWrapper(
+                io.BufferedWriter(
+                    io.FileIO(sys.stderr.fileno(), "wb", closefd=False),
+                    buffer_size=8192,
+                ),
+                write_through=False,
+            )
+            atexit.register(self._buffer.flush)
+        except (AttributeError, OSError, ValueError):
+            self._buffer = sys.stderr
+
+        # integer level keys are cheaper to hash than the level names, and
+        # the precomputed suffix saves an f-string per record
+        self._prefixes = {
+            getattr(logging, levelName): code
+            for levelName, code in self.COLOR_CODES.items()
+        }
+        self._suffix = self.RESET_CODE + "\n"
+
+        # decide once whether colors are wanted; piped output gets the
+        # plain variant without any ANSI escapes
+        useColor = sys.stderr.isatty() and os.environ.get("NO_COLOR") is None
+        self.emit = self._EmitColored if useColor else self._EmitPlain  # type: ignore[method-assign]
+
+    def _EmitColored(self, record: logging.LogRecord) -> None:
+        prefix = self._prefixes.get(record.levelno, self.RESET_CODE)
+
+        self._buffer.write(prefix)
+        self._buffer.write(self.format(record))
+        self._buffer.write(self._suffix)
+
+        if record.levelno >= logging.WARNING:
+            self._buffer.flush()
+
+    def _EmitPlain(self, record: logging.LogRecord) -> None:
+        self._buffer.write(self.format(record) + "\n")
+
+        if record.levelno >= logging.WARNING:
+            self._buffer.flush()
+
+    emit = _EmitColored
+
+    def flush(self) -> None:
+        self._buffer.flush()
 
 
 logger = logging.getLogger("MANAGER")
@@ -28,3 +86,11 @@ formatter = logging.Formatter("[%(name)7s] - [%(levelname)7s] - %(message)s")
 handler = ColorStreamHandler()
 handler.setFormatter(formatter)
 logger.addHandler(handler)
+
+
+def FlushLogs() -> None:
+    """
+    Flush any buffered log records, e.g. before handing the terminal to
+    a subprocess so progress lines appear ahead of its output.
+    """
+    handler.flush()
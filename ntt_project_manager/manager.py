@@ -1,18 +1,130 @@
 import os
 import re
+import sys
 import json
+import pickle
 import logging
-import argparse
-from .models import *
+import functools
+from .models import (
+    BUILD_TYPES,
+    IS_WINDOWS,
+    _DEFAULT_SETTINGS_JSON,
+    BuildType,
+    ExecutableConfig,
+    Project,
+    ProjectLanguage,
+    ProjectType,
+    Settings,
+    SystemInfo,
+)
 from .log import logger
-from jinja2 import Template
-from dacite import from_dict
-from dataclasses import asdict
 from .utils import RunCommand, ValidateCommandExist
 
 
 SETTING_NAME = "settings.json"
 
+_SEP = os.sep
+
+# bump whenever the pickled sidecar tuple layout changes, so sidecars
+# written by an older layout are rebuilt instead of mis-unpacked
+_CACHE_FORMAT_VERSION = 1
+
+# patterns of the config/*.cfg format, compiled once
+_INCLUDE_RE = re.compile(r"<(.+)>")
+_KEY_VALUE_RE = re.compile(r"(\w+)\s*=\s*(.+)")
+
+try:
+    import orjson
+
+    def _LoadsJson(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _DumpsJson(obj: dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _LoadsJson(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _DumpsJson(obj: dict) -> bytes:
+        return json.dumps(obj, indent=4).encode()
+
+
+@functools.lru_cache(maxsize=128)
+def _CompileTemplate(source: str):
+    """
+    Compile a Jinja template once per distinct source string; repeated
+    renders of the same options/path template reuse the compiled result.
+    The jinja2 import stays deferred to the first actual compilation.
+    """
+    from jinja2 import Template
+
+    return Template(source)
+
+
+def _MaybeRender(source: str, constants: dict[str, str]) -> str:
+    """
+    Render the source as a Jinja template, short-circuiting to the
+    string itself when it contains no template markers — the common
+    static-options case then never touches Jinja at all.
+    """
+    if "{{" not in source and "{%" not in source:
+        return source
+
+    return _CompileTemplate(source).render(**constants)
+
+
+def _MakeLazySubparsersAction():
+    """
+    Build the lazy subparsers action class. Defined behind a function so
+    that `argparse` is only imported when the arguments are actually
+    parsed, not on every import of this module.
+    """
+    import argparse
+
+    class LazySubparsersAction(argparse._SubParsersAction):
+        """
+        A subparsers action which delays the construction of each subparser
+        until its name is actually chosen on the command line.
+
+        Registering via `add_parser(name, factory=..., help=...)` only stores
+        the factory callback; the real parser (and anything expensive inside
+        the factory, like the `choices` lists) is built in `__call__` for the
+        one subcommand the user typed.
+        """
+
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            self._lazyFactories: dict = {}
+
+        def add_parser(self, name, *, factory=None, **kwargs):
+            if factory is None:
+                return super().add_parser(name, **kwargs)
+
+            if kwargs.get("help") is not None:
+                choiceAction = self._ChoicesPseudoAction(name, (), kwargs.pop("help"))
+                self._choices_actions.append(choiceAction)
+
+            # placeholder so the subcommand name passes the choices check
+            self._name_parser_map[name] = None
+            self._lazyFactories[name] = (factory, kwargs)
+            return None
+
+        def __call__(self, parser, namespace, values, option_string=None):
+            parserName = values[0]
+
+            lazy = self._lazyFactories.pop(parserName, None)
+            if lazy is not None:
+                factory, kwargs = lazy
+                del self._name_parser_map[parserName]
+                subparser = super().add_parser(parserName, **kwargs)
+                factory(subparser)
+
+            super().__call__(parser, namespace, values, option_string)
+
+    return LazySubparsersAction
+
 
 class Manager:
     def __init__(self, baseDir: str | None = None) -> None:
@@ -20,16 +132,20 @@ class Manager:
 
         settingFile = os.path.join(self._baseDir, SETTING_NAME)
 
-        if not os.path.exists(self._baseDir):
+        # EAFP: opening the file directly saves the exists() stat calls on
+        # the common path where the settings file is already there.
+        try:
+            settingStream = open(settingFile, "rb")
+        except FileNotFoundError:
             os.makedirs(self._baseDir, exist_ok=True)
 
-        if not os.path.exists(settingFile):
-            with open(settingFile, "w") as f:
-                json.dump(asdict(Settings()), f, indent=4)
+            with open(settingFile, "wb") as f:
+                f.write(_DEFAULT_SETTINGS_JSON)
+
+            settingStream = open(settingFile, "rb")
 
-        with open(settingFile, "r") as f:
-            data = json.load(f)
-            self.settings = from_dict(data_class=Settings, data=data)
+        with settingStream:
+            self._LoadSettings(settingFile, settingStream)
 
         self._ExtractSystemInformation()
         self._ExtractInformation()
@@ -37,31 +153,133 @@ class Manager:
 
         self._Execute()
 
+    def _LoadSettings(self, settingFile: str, settingStream) -> None:
+        """
+        Load the settings from the already-opened setting file. The parsed
+        `Settings` instance is cached in a pickle sidecar keyed on the
+        JSON file's mtime, so repeated invocations skip the JSON parsing
+        work entirely until the settings change.
+        """
+        cacheFile = settingFile + ".cache"
+        st = os.fstat(settingStream.fileno())
+        cacheKey = (_CACHE_FORMAT_VERSION, st.st_mtime_ns, st.st_size)
+
+        try:
+            with open(cacheFile, "rb") as f:
+                cached = pickle.load(f)
+
+            if cached[0] == cacheKey:
+                (
+                    _,
+                    self.settings,
+                    self._cProjects,
+                    self._pythonProjects,
+                    self._projectsDict,
+                    self._exampleTargets,
+                    self._executablesByName,
+                    self._cNames,
+                    self._pyNames,
+                    self._runNames,
+                    self._testNames,
+                    self._exampleNames,
+                ) = cached
+                return
+        except Exception:
+            # missing, corrupt or old-layout cache: silently take the
+            # slow path and rewrite it below
+            pass
+
+        data = _LoadsJson(settingStream.read())
+        self.settings = Settings.FromDict(data)
+
+        # the derived buckets are cached alongside the settings so warm
+        # invocations skip the per-project scans as well
+        self._ExtractInformation()
+
+        # write-then-replace keeps the cache atomic even if two
+        # invocations race or the process dies mid-write; a failed write
+        # (e.g. read-only settings directory) only costs the cache
+        tmpFile = cacheFile + ".tmp"
+
+        try:
+            with open(tmpFile, "wb") as f:
+                pickle.dump(
+                    (
+                        cacheKey,
+                        self.settings,
+                        self._cProjects,
+                        self._pythonProjects,
+                        self._projectsDict,
+                        self._exampleTargets,
+                        self._executablesByName,
+                        self._cNames,
+                        self._pyNames,
+                        self._runNames,
+                        self._testNames,
+                        self._exampleNames,
+                    ),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+
+            os.replace(tmpFile, cacheFile)
+        except OSError:
+            logger.debug(f'Cannot write the settings cache: "{cacheFile}", skip it')
+
     def _ExtractSystemInformation(self) -> None:
-        self._systemInfo = SystemInfo()
+        # every SystemInfo field is a class-level constant, so the class
+        # itself serves as the (shared) instance
+        self._systemInfo = SystemInfo
 
     def _ExtractInformation(self) -> None:
+        if hasattr(self, "_projectsDict"):
+            # the buckets were restored from the settings cache
+            return
+
         self._cProjects: list[Project] = []
         self._pythonProjects: list[Project] = []
+        self._projectsDict: dict[str, Project] = {}
         self._exampleTargets: dict[str, Project] = {}
+        self._executablesByName: dict[str, dict[str, ExecutableConfig]] = {}
+
+        # hoist the enum member lookups out of the loop
+        cLanguage = ProjectLanguage.C
+        pythonLanguage = ProjectLanguage.PYTHON
 
         for project in self.settings.projects:
-            if project.language == ProjectLanguage.C.value:
+            language = project.language
+
+            if language is cLanguage:
                 self._cProjects.append(project)
-            elif project.language == ProjectLanguage.PYTHON.value:
+
+                if project.executables is not None:
+                    executablesByName: dict[str, ExecutableConfig] = {}
+
+                    for example in project.executables:
+                        executablesByName[sys.intern(example.name)] = example
+
+                        if example.name != "run" and example.name != "test":
+                            self._exampleTargets[sys.intern(example.name)] = project
+
+                    self._executablesByName[project.name] = executablesByName
+            elif language is pythonLanguage:
                 self._pythonProjects.append(project)
+            else:
+                continue
 
-        self._projectsDict: dict[str, Project] = {}
-        for project in self._cProjects + self._pythonProjects:
-            self._projectsDict[project.name] = project
+            self._projectsDict[sys.intern(project.name)] = project
 
-        for project in self._cProjects:
-            if project.executables is not None:
-                for example in project.executables:
-                    if example.name != "run" and example.name != "test":
-                        self._exampleTargets[example.name] = project
+        self._cNames = tuple(p.name for p in self._cProjects)
+        self._pyNames = tuple(p.name for p in self._pythonProjects)
+        self._runNames = self._pyNames + self._cNames
+        self._testNames = tuple(
+            p.name for p in self._cProjects if p.type is ProjectType.LIBRARY
+        )
+        self._exampleNames = tuple(self._exampleTargets)
 
     def _ExtractArgs(self) -> None:
+        import argparse
+
         assert self._cProjects is not None
         assert self._pythonProjects is not None
 
@@ -76,6 +294,14 @@ class Manager:
             help="Enable verbose output for detailed logging information.",
         )
 
+        parser.add_argument(
+            "--no-fuse",
+            dest="noFuse",
+            action="store_true",
+            help="Run the cmake generate and build steps as separate commands "
+            "instead of a single fused shell invocation.",
+        )
+
         parser.add_argument(
             "--type",
             "-t",
@@ -85,74 +311,167 @@ class Manager:
             help="Specify the build type (debug, release, web). Default is debug.",
         )
 
-        subparsers = parser.add_subparsers(dest="command")
+        # sentinel defaults so the namespace always carries these
+        # attributes, keeping the dispatch below to plain attribute reads
+        parser.set_defaults(projectName=None, exampleName=None)
 
-        buildParser = subparsers.add_parser(
-            "build", help="Build the specified project."
+        subparsers = parser.add_subparsers(
+            dest="command", action=_MakeLazySubparsersAction()
         )
 
-        buildParser.add_argument(
-            "projectName",
-            type=str,
-            choices=[p.name for p in self._cProjects],
-            help="Name of the project to build.",
-        )
+        def _AddBuildArgs(buildParser: argparse.ArgumentParser) -> None:
+            buildParser.add_argument(
+                "projectName",
+                type=str,
+                help="Name of the project to build.",
+            )
 
-        runParser = subparsers.add_parser("run", help="Run the specified project.")
+        def _AddRunArgs(runParser: argparse.ArgumentParser) -> None:
+            runParser.add_argument(
+                "projectName",
+                type=str,
+                help="Name of the project to run.",
+            )
 
-        runParser.add_argument(
-            "projectName",
-            type=str,
-            choices=[p.name for p in self._pythonProjects + self._cProjects],
-            help="Name of the project to run.",
-        )
+        def _AddTestArgs(testParser: argparse.ArgumentParser) -> None:
+            testParser.add_argument(
+                "projectName",
+                type=str,
+                help="Name of the project to test.",
+            )
 
-        testParser = subparsers.add_parser("test", help="Test the specified project.")
+        def _AddExampleArgs(exampleParser: argparse.ArgumentParser) -> None:
+            exampleParser.add_argument(
+                "exampleName",
+                type=str,
+                help="Name of the example project to run.",
+            )
 
-        testParser.add_argument(
-            "projectName",
-            type=str,
-            choices=[
-                p.name for p in self._cProjects if p.type == ProjectType.LIBRARY.value
-            ],
-            help="Name of the project to test.",
+        subparsers.add_parser(
+            "build",
+            factory=_AddBuildArgs,
+            help="Build the specified project.",
         )
-
-        exampleParser = subparsers.add_parser(
+        subparsers.add_parser(
+            "run",
+            factory=_AddRunArgs,
+            help="Run the specified project.",
+        )
+        subparsers.add_parser(
+            "test",
+            factory=_AddTestArgs,
+            help="Test the specified project.",
+        )
+        subparsers.add_parser(
             "example",
+            factory=_AddExampleArgs,
             help="Manage and run example projects.",
         )
 
-        exampleParser.add_argument(
-            "exampleName",
-            type=str,
-            choices=list(self._exampleTargets.keys()),
-            help="Name of the example project to run.",
-        )
-
         self.args = parser.parse_args()
 
+        # validate the chosen name against the O(1) lookup dicts instead
+        # of handing argparse a choices list per subparser
+        if self.args.command == "build":
+            if self.args.projectName not in self._cNames:
+                parser.error(
+                    f'invalid choice: "{self.args.projectName}" '
+                    f'(choose from {", ".join(self._cNames)})'
+                )
+        elif self.args.command == "run":
+            if self.args.projectName not in self._runNames:
+                parser.error(
+                    f'invalid choice: "{self.args.projectName}" '
+                    f'(choose from {", ".join(self._runNames)})'
+                )
+        elif self.args.command == "test":
+            if self.args.projectName not in self._testNames:
+                parser.error(
+                    f'invalid choice: "{self.args.projectName}" '
+                    f'(choose from {", ".join(self._testNames)})'
+                )
+        elif self.args.command == "example":
+            if self.args.exampleName not in self._exampleNames:
+                parser.error(
+                    f'invalid choice: "{self.args.exampleName}" '
+                    f'(choose from {", ".join(self._exampleNames)})'
+                )
+
         if self.args.verbose:
             logger.setLevel(logging.DEBUG)
             logger.debug("Verbose mode enabled.")
         else:
             logger.setLevel(logging.INFO)
 
+    def _ValidateNeededCommands(self) -> None:
+        """
+        Check that every needed command exists, memoized across
+        invocations: a marker file keyed on the PATH and the command set
+        is kept under ~/.cache/ntt/validated, so the PATH walk only
+        happens again when either of them changes.
+        """
+        commands = self.settings.config.neededCommands
+
+        if not commands:
+            return
+
+        import hashlib
+
+        key = hashlib.blake2b(
+            os.environ.get("PATH", "").encode()
+            + b"\0"
+            + "\0".join(sorted(commands)).encode(),
+            digest_size=8,
+        ).hexdigest()
+
+        markerFile = os.path.join(
+            os.path.expanduser("~"), ".cache", "ntt", "validated", key
+        )
+
+        # the marker stores the resolved paths; a cheap exists() per
+        # binary confirms the cache instead of re-walking the PATH
+        try:
+            with open(markerFile, "rb") as f:
+                resolvedPaths = _LoadsJson(f.read())
+
+            if all(os.path.exists(path) for path in resolvedPaths.values()):
+                return
+        except Exception:
+            # missing, corrupt or wrong-shaped marker: revalidate below
+            pass
+
+        if len(commands) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                # consuming the iterator re-raises the first failure
+                resolved = dict(zip(commands, pool.map(ValidateCommandExist, commands)))
+        else:
+            resolved = {commands[0]: ValidateCommandExist(commands[0])}
+
+        # an unwritable cache directory (read-only HOME, containers)
+        # only costs the memoization, never the command
+        try:
+            os.makedirs(os.path.dirname(markerFile), exist_ok=True)
+
+            with open(markerFile, "wb") as f:
+                f.write(_DumpsJson(resolved))
+        except OSError:
+            logger.debug(f'Cannot write the command marker: "{markerFile}", skip it')
+
     def _Execute(self) -> None:
-        for command in self.settings.config.neededCommands:
-            ValidateCommandExist(command)
+        self._ValidateNeededCommands()
 
         if self.args.command == "build":
-            projectName = self.args.projectName
-            self._ExtractCProjectInformation(self.args.projectName)
+            projectName = sys.intern(self.args.projectName)
+            self._ExtractCProjectInformation(projectName)
 
             logger.info(
                 f'Building project: "{projectName}" of type: "{self._cProject.type}" with build type: "{self.args.type}"'
             )
 
-            if self._cProject.language == ProjectLanguage.C:
-                RunCommand(self._cProjectGenerateCommand, cwd=self._cProjectBaseDir)
-                RunCommand(self._cProjectBuildCommand, cwd=self._cProjectBaseDir)
+            if self._cProject.language is ProjectLanguage.C:
+                self._RunCMakeGenerateAndBuild()
             else:
                 logger.error(
                     f'Build not supported for language: "{self._cProject.language}"'
@@ -160,29 +479,18 @@ class Manager:
                 raise RuntimeError("Build failed due to unsupported language.")
 
         elif self.args.command == "run":
-            projectName = self.args.projectName
+            projectName = sys.intern(self.args.projectName)
             project = self._projectsDict.get(projectName)
             assert project is not None, "Project not found."
 
-            if project.language == ProjectLanguage.PYTHON.value:
+            if project.language is ProjectLanguage.PYTHON:
                 logger.info(f'Running Python project: "{projectName}"')
-                projectBaseDir = os.path.join(self._baseDir, project.name)
+                projectBaseDir = f"{self._baseDir}{_SEP}{project.name}"
 
                 RunCommand("uv sync", cwd=projectBaseDir)
                 RunCommand("uv run main.py", cwd=projectBaseDir)
-            elif project.language == ProjectLanguage.C.value:
-                executable: ExecutableConfig | None = None
-                project = self._projectsDict.get(projectName)
-
-                assert project is not None, "Project not found."
-                assert (
-                    project.executables is not None
-                ), "No executables defined for project."
-
-                for executable in project.executables:
-                    if executable.name == "run":
-                        executable = executable
-                        break
+            elif project.language is ProjectLanguage.C:
+                executable = self._executablesByName.get(projectName, {}).get("run")
 
                 assert executable is not None, 'No executable named "run" found.'
 
@@ -190,27 +498,15 @@ class Manager:
 
                 logger.info(f'Running C project: "{projectName}"')
 
-                RunCommand(self._cProjectGenerateCommand, cwd=self._cProjectBaseDir)
-                RunCommand(self._cProjectBuildCommand, cwd=self._cProjectBaseDir)
+                self._RunCMakeGenerateAndBuild()
                 if self._cExecutablePath is not None:
                     RunCommand(self._cExecutablePath, cwd=self._cProjectBaseDir)
             else:
                 logger.error(f'Run not supported for language: "{project.language}"')
                 raise RuntimeError("Run failed due to unsupported language.")
         elif self.args.command == "test":
-            projectName = self.args.projectName
-            executable: ExecutableConfig | None = None
-            project = self._projectsDict.get(projectName)
-
-            assert project is not None, "Project not found."
-            assert (
-                project.executables is not None
-            ), "No executables defined for project."
-
-            for executable in project.executables:
-                if executable.name == "test":
-                    executable = executable
-                    break
+            projectName = sys.intern(self.args.projectName)
+            executable = self._executablesByName.get(projectName, {}).get("test")
 
             assert executable is not None, 'No executable named "test" found.'
 
@@ -218,27 +514,16 @@ class Manager:
 
             logger.info(f'Testing project: "{projectName}"')
 
-            RunCommand(self._cProjectGenerateCommand, cwd=self._cProjectBaseDir)
-            RunCommand(self._cProjectBuildCommand, cwd=self._cProjectBaseDir)
+            self._RunCMakeGenerateAndBuild()
             if self._cExecutablePath is not None:
                 RunCommand(self._cExecutablePath, cwd=self._cProjectBaseDir)
 
         elif self.args.command == "example":
-            exampleName = self.args.exampleName
+            exampleName = sys.intern(self.args.exampleName)
             project = self._exampleTargets.get(exampleName)
             assert project is not None, "Example project not found."
-            assert project.executables is not None
-
-            if exampleName not in self._exampleTargets:
-                logger.error(f'Example "{exampleName}" not found.')
-                raise RuntimeError("Example run failed due to missing example.")
 
-            executable: ExecutableConfig | None = None
-
-            for executable in project.executables:
-                if executable.name == exampleName:
-                    executable = executable
-                    break
+            executable = self._executablesByName.get(project.name, {}).get(exampleName)
 
             assert executable is not None, "Executable configuration not found."
 
@@ -249,11 +534,25 @@ class Manager:
             logger.info(
                 f'Running example: "{exampleName}" from project: "{project.name}"'
             )
-            RunCommand(self._cProjectGenerateCommand, cwd=self._cProjectBaseDir)
-            RunCommand(self._cProjectBuildCommand, cwd=self._cProjectBaseDir)
+            self._RunCMakeGenerateAndBuild()
             if self._cExecutablePath is not None:
                 RunCommand(self._cExecutablePath, cwd=self._cProjectBaseDir)
 
+    def _RunCMakeGenerateAndBuild(self) -> None:
+        """
+        Run the cmake generate and build steps. They are fused into one
+        shell invocation (short-circuiting on generate failure) to save a
+        process spawn per build; `--no-fuse` restores the separate calls.
+        """
+        if self.args.noFuse:
+            RunCommand(self._cProjectGenerateCommand, cwd=self._cProjectBaseDir)
+            RunCommand(self._cProjectBuildCommand, cwd=self._cProjectBaseDir)
+        else:
+            RunCommand(
+                f"{self._cProjectGenerateCommand} && {self._cProjectBuildCommand}",
+                cwd=self._cProjectBaseDir,
+            )
+
     def _ExtractCProjectInformation(
         self,
         projectName: str,
@@ -265,15 +564,16 @@ class Manager:
         self._cProject = project
 
         assert (
-            project.language == ProjectLanguage.C.value
+            project.language is ProjectLanguage.C
         ), "Project is not a C project."
 
-        self._cProjectBaseDir = os.path.join(self._baseDir, project.name)
-        self._cProjectBuildDir = os.path.join(
-            self._cProjectBaseDir,
-            "build",
-            f"{self._systemInfo.PLATFORM}",
-            f"{self.args.type}",
+        # the components are known-clean, so plain f-strings beat the
+        # normalization logic inside os.path.join
+        platform = self._systemInfo.PLATFORM
+        self._cProjectBaseDir = f"{self._baseDir}{_SEP}{project.name}"
+        self._cProjectBuildDir = (
+            f"{self._cProjectBaseDir}{_SEP}build"
+            f"{_SEP}{platform}{_SEP}{self.args.type}"
         )
 
         constants: dict[str, str] = {
@@ -281,12 +581,12 @@ class Manager:
             "PROJECT_DIR": self._cProjectBaseDir,
             "PROJECT_NAME": project.name,
             "BUILD_TYPE": self.args.type,
-            "PLATFORM": self._systemInfo.PLATFORM,
+            "PLATFORM": platform,
         }
 
         self._cProjectOsOptions: str = ""
 
-        if os.name == "nt":
+        if IS_WINDOWS:
             osConfig = self.settings.config.windows
         else:
             osConfig = self.settings.config.linux
@@ -301,8 +601,9 @@ class Manager:
             if buildTypeConfig is not None:
                 self._cProjectAddtionalOptions = buildTypeConfig.options
 
-        addtionalOptionsTemplate = Template(self._cProjectAddtionalOptions)
-        self._cProjectAddtionalOptions = addtionalOptionsTemplate.render(**constants)
+        self._cProjectAddtionalOptions = _MaybeRender(
+            self._cProjectAddtionalOptions, constants
+        )
 
         # load config/<file>.cfg if exists
         configFilesOptions: dict[str, str] = self._ExtractCConfigFilesOptions()
@@ -311,11 +612,18 @@ class Manager:
             [f"-D{key}={value}" for key, value in configFilesOptions.items()]
         )
 
-        self._cProjectGenerateCommand = (
-            f"cmake -B {self._cProjectBuildDir} "
-            f"{self._cProjectOsOptions} "
-            f"{self._cProjectAddtionalOptions} "
-            f"{configFilesOptionsString} "
+        # one join over the non-empty parts, so no intermediate strings
+        # and no stray whitespace reaches the shell
+        self._cProjectGenerateCommand = " ".join(
+            filter(
+                None,
+                (
+                    f"cmake -B {self._cProjectBuildDir}",
+                    self._cProjectOsOptions,
+                    self._cProjectAddtionalOptions,
+                    configFilesOptionsString,
+                ),
+            )
         )
 
         self._cProjectBuildCommand = (
@@ -325,52 +633,91 @@ class Manager:
         self._cExecutableCommand: str | None = None
 
         if executable is not None:
-            if self._systemInfo.PLATFORM == "windows":
+            if IS_WINDOWS:
                 executablePath = executable.windowsPath
             else:
                 executablePath = executable.linuxPath
 
-            executableTemplate = Template(executablePath)
-            self._cExecutablePath = executableTemplate.render(**constants)
+            self._cExecutablePath = _MaybeRender(executablePath, constants)
 
     def _ExtractCConfigFilesOptions(self) -> dict[str, str]:
-        return self._ExtractCConfigFilesOptionsInternal(self.args.type + ".cfg")
-
-    def _ExtractCConfigFilesOptionsInternal(self, name: str) -> dict[str, str]:
         configDir = os.path.join(self._cProjectBaseDir, "config")
-        filePath = os.path.join(configDir, name)
 
-        if not os.path.exists(filePath):
+        # list the config directory once; each (included) file is then a
+        # set lookup instead of its own exists() syscall
+        try:
+            with os.scandir(configDir) as entries:
+                existingFiles = {entry.name for entry in entries}
+        except FileNotFoundError:
             return {}
 
-        with open(filePath, "r") as f:
-            content = f.read()
-
-        lines = content.splitlines()
-        options: dict[str, str] = {}
+        return self._ExtractCConfigFilesOptionsInternal(
+            self.args.type + ".cfg", configDir, existingFiles, {}
+        )
 
-        for line in lines:
-            line = line.strip()
+    def _ExtractCConfigFilesOptionsInternal(
+        self,
+        name: str,
+        configDir: str,
+        existingFiles: set[str],
+        seen: dict[str, dict[str, str] | None],
+    ) -> dict[str, str]:
+        if name not in existingFiles:
+            # the prefetched set only holds the top-level names; an
+            # include pointing into a subdirectory falls back to a real
+            # exists() probe instead of being dropped
+            hasPathPart = "/" in name or _SEP in name
+
+            if not hasPathPart or not os.path.exists(os.path.join(configDir, name)):
+                return {}
+
+        if name in seen:
+            cached = seen[name]
+
+            if cached is None:
+                # include cycle: the file is still being parsed
+                logger.warning(f'Circular include of "{name}" ignored.')
+                return {}
+
+            # a diamond-shaped include graph reuses the parsed result
+            return cached
+
+        # sentinel for cycle detection while this file is being parsed
+        seen[name] = None
 
-            if line == "" or line.startswith("#"):
-                continue
+        filePath = os.path.join(configDir, name)
 
-            # check include pattern <file>
-            includeMatch = re.match(r"<(.+)>", line)
-            if includeMatch:
-                includeFileName = includeMatch.group(1)
-                includedOptions = self._ExtractCConfigFilesOptionsInternal(
-                    includeFileName
-                )
-                options.update(includedOptions)
-                continue
+        options: dict[str, str] = {}
 
-            # check key=value pattern
-            keyValueMatch = re.match(r"(\w+)\s*=\s*(.+)", line)
-            if keyValueMatch:
-                key = keyValueMatch.group(1)
-                value = keyValueMatch.group(2)
-                options[key] = value
-                continue
+        # iterate the file object directly instead of materializing the
+        # whole content plus a list of lines
+        with open(filePath, "r", buffering=65536) as f:
+            for raw in f:
+                line = raw.strip()
+
+                if line == "" or line.startswith("#"):
+                    continue
+
+                # check include pattern <file>; the cheap first-character
+                # test skips the regex for ordinary option lines
+                if line[0] == "<":
+                    includeMatch = _INCLUDE_RE.match(line)
+                    if includeMatch:
+                        includeFileName = includeMatch.group(1)
+                        includedOptions = self._ExtractCConfigFilesOptionsInternal(
+                            includeFileName, configDir, existingFiles, seen
+                        )
+                        options.update(includedOptions)
+                        continue
+
+                # check key=value pattern
+                keyValueMatch = _KEY_VALUE_RE.match(line)
+                if keyValueMatch:
+                    key = keyValueMatch.group(1)
+                    value = keyValueMatch.group(2)
+                    options[key] = value
+                    continue
+
+        seen[name] = options
 
         return options
@@ -2,6 +2,8 @@ import os
 from enum import StrEnum
 from dataclasses import dataclass, field
 
+from .log import logger
+
 """
 Json examples
 {
@@ -70,6 +72,13 @@ BUILD_TYPES = [btype.value for btype in BuildType]
 class BuildTypeConfig:
     options: str = field(default="")
 
+    @classmethod
+    def FromDict(cls, data: dict) -> "BuildTypeConfig":
+        return cls(options=data.get("options", ""))
+
+    def ToJson(self) -> dict:
+        return {"options": self.options}
+
 
 @dataclass
 class ExecutableConfig:
@@ -77,6 +86,13 @@ class ExecutableConfig:
     windowsPath: str
     linuxPath: str
 
+    def ToJson(self) -> dict:
+        return {
+            "name": self.name,
+            "windowsPath": self.windowsPath,
+            "linuxPath": self.linuxPath,
+        }
+
 
 @dataclass
 class Project:
@@ -93,11 +109,74 @@ class Project:
     """
 
     name: str
-    language: str = field(default=ProjectLanguage.C.value)
-    type: str = field(default=ProjectType.EXECUTABLE.value)
+    language: ProjectLanguage | str = field(default=ProjectLanguage.C)
+    type: ProjectType | str = field(default=ProjectType.EXECUTABLE)
     buildTypesConfig: dict[str, BuildTypeConfig] | None = field(default=None)
     executables: list[ExecutableConfig] | None = field(default=None)
 
+    def __post_init__(self) -> None:
+        # normalize the raw JSON strings into enum members once, so the
+        # rest of the code can use identity compares; unknown values keep
+        # the raw string and the project is simply never bucketed
+        if not isinstance(self.language, ProjectLanguage):
+            try:
+                self.language = ProjectLanguage(self.language)
+            except ValueError:
+                logger.warning(
+                    f'Project "{self.name}" has unknown language: "{self.language}", ignore it'
+                )
+
+        if not isinstance(self.type, ProjectType):
+            try:
+                self.type = ProjectType(self.type)
+            except ValueError:
+                logger.warning(
+                    f'Project "{self.name}" has unknown type: "{self.type}", ignore it'
+                )
+
+    @classmethod
+    def FromDict(cls, data: dict) -> "Project":
+        buildTypesConfig = data.get("buildTypesConfig")
+        if buildTypesConfig is not None:
+            buildTypesConfig = {
+                buildType: BuildTypeConfig.FromDict(config)
+                for buildType, config in buildTypesConfig.items()
+            }
+
+        executables = data.get("executables")
+        if executables is not None:
+            executables = [ExecutableConfig(**executable) for executable in executables]
+
+        return cls(
+            name=data["name"],
+            language=data.get("language", ProjectLanguage.C.value),
+            type=data.get("type", ProjectType.EXECUTABLE.value),
+            buildTypesConfig=buildTypesConfig,
+            executables=executables,
+        )
+
+    def ToJson(self) -> dict:
+        # str() gives the enum value for StrEnum members and passes raw
+        # (unrecognized) strings through unchanged
+        data: dict = {
+            "name": self.name,
+            "language": str(self.language),
+            "type": str(self.type),
+        }
+
+        if self.buildTypesConfig is not None:
+            data["buildTypesConfig"] = {
+                buildType: config.ToJson()
+                for buildType, config in self.buildTypesConfig.items()
+            }
+
+        if self.executables is not None:
+            data["executables"] = [
+                executable.ToJson() for executable in self.executables
+            ]
+
+        return data
+
 
 class CMakeTools(StrEnum):
     """
@@ -117,6 +196,13 @@ CMAKE_TOOLS = [tool.value for tool in CMakeTools]
 class OSBuildConfig:
     cmake_tool: str = field(default=CMakeTools.UNIX.value)
 
+    @classmethod
+    def FromDict(cls, data: dict) -> "OSBuildConfig":
+        return cls(cmake_tool=data.get("cmake_tool", CMakeTools.UNIX.value))
+
+    def ToJson(self) -> dict:
+        return {"cmake_tool": self.cmake_tool}
+
 
 @dataclass
 class BuildConfig:
@@ -127,13 +213,80 @@ class BuildConfig:
 
     neededCommands: list[str] = field(default_factory=lambda: ["cmake", "git"])
 
+    @classmethod
+    def FromDict(cls, data: dict) -> "BuildConfig":
+        config = cls()
+
+        if "windows" in data:
+            config.windows = OSBuildConfig.FromDict(data["windows"])
+
+        if "linux" in data:
+            config.linux = OSBuildConfig.FromDict(data["linux"])
+
+        if "neededCommands" in data:
+            config.neededCommands = data["neededCommands"]
+
+        return config
+
+    def ToJson(self) -> dict:
+        return {
+            "windows": self.windows.ToJson(),
+            "linux": self.linux.ToJson(),
+            "neededCommands": self.neededCommands,
+        }
+
 
 @dataclass
 class Settings:
     config: BuildConfig = field(default_factory=BuildConfig)
     projects: list[Project] = field(default_factory=list)  # type: ignore
 
+    @classmethod
+    def FromDict(cls, data: dict) -> "Settings":
+        """
+        Construct the settings tree directly from the parsed JSON data.
+        Each nested dataclass is built explicitly, which avoids the
+        per-field reflection that a generic deserializer would pay.
+        """
+        return cls(
+            config=BuildConfig.FromDict(data.get("config", {})),
+            projects=[Project.FromDict(project) for project in data.get("projects", [])],
+        )
+
+    def ToJson(self) -> dict:
+        """
+        Serialize the settings tree into plain dicts from the known
+        fields directly — the explicit inverse of FromDict, without the
+        recursive copy that dataclasses.asdict would do.
+        """
+        return {
+            "config": self.config.ToJson(),
+            "projects": [project.ToJson() for project in self.projects],
+        }
+
+
+# pre-rendered default settings.json content; the default Settings()
+# tree is static, so the first-run write needs no asdict/json work
+_DEFAULT_SETTINGS_JSON: bytes = b"""{
+    "config": {
+        "windows": {
+            "cmake_tool": "Visual Studio 17 2022"
+        },
+        "linux": {
+            "cmake_tool": "Unix Makefiles"
+        },
+        "neededCommands": [
+            "cmake",
+            "git"
+        ]
+    },
+    "projects": []
+}"""
+
+
+IS_WINDOWS = os.name == "nt"
+
 
 class SystemInfo:
-    PLATFORM: str = "windows" if os.name == "nt" else "linux"
-    EXECUTABLE_SUFFIX: str = ".exe" if os.name == "nt" else ""
+    PLATFORM: str = "windows" if IS_WINDOWS else "linux"
+    EXECUTABLE_SUFFIX: str = ".exe" if IS_WINDOWS else ""
@@ -1,6 +1,13 @@
 import os
+import shlex
+import shutil
+import functools
 import subprocess
-from .log import logger
+from .log import FlushLogs, logger
+
+
+# operators that require a real shell to interpret the command
+_SHELL_OPERATORS = ("&&", "||", "|", ">", "<", ";")
 
 
 def RunCommand(
@@ -9,6 +16,14 @@ def RunCommand(
 ) -> None:
     """
     Run a system command.
+
+    Plain commands are executed directly, skipping the intermediate
+    shell process; only commands containing shell operators (pipes,
+    redirections, &&, ...) go through the shell. On POSIX the command is
+    tokenized with shlex; on Windows the raw string is handed to
+    CreateProcess as-is, since shlex does not follow the Windows quoting
+    rules and re-tokenizing would mangle quoted arguments.
+
     Arguments
     ---------
     command : str
@@ -20,37 +35,48 @@ def RunCommand(
 
     logger.debug(f'Run command: "{command}" at: "{finalCWD}"')
 
-    finalCommand = command
+    # the subprocess writes to the real stderr, so any buffered progress
+    # lines must go out first to keep the output in order
+    FlushLogs()
 
-    subprocess.run(
-        finalCommand,
-        cwd=finalCWD,
-        shell=True,
-        check=True,
-    )
+    if any(operator in command for operator in _SHELL_OPERATORS):
+        subprocess.run(
+            command,
+            cwd=finalCWD,
+            shell=True,
+            check=True,
+        )
+    elif os.name == "nt":
+        subprocess.run(
+            command,
+            cwd=finalCWD,
+            check=True,
+        )
+    else:
+        subprocess.run(
+            shlex.split(command),
+            cwd=finalCWD,
+            check=True,
+        )
 
 
+@functools.lru_cache(maxsize=None)
 def ValidateCommandExist(
     command: str,
-) -> None:
+) -> str:
     """
     Used for checking the system health whereas a certain command exists or not.
-    If the command does not exist, raise error
+    If the command does not exist, raise error; otherwise return the
+    resolved executable path.
+
+    The lookup walks the PATH in-process via shutil.which (no where/which
+    subprocess) and is cached per command for the lifetime of the process.
     """
     logger.debug(f"Checking command: {command}")
 
-    try:
-        if os.name == "nt":
-            subprocess.run(
-                ["where", command],
-                check=True,
-                stdout=subprocess.DEVNULL,
-            )
-        else:
-            subprocess.run(
-                ["which", command],
-                check=True,
-                stdout=subprocess.DEVNULL,
-            )
-    except Exception as _:
+    resolved = shutil.which(command)
+
+    if resolved is None:
         raise SystemError(f'The command "{command}" does not exist')
+
+    return resolved
@@ -0,0 +1,22 @@
+"""
+Optional mypyc build, enabled with NTT_MYPYC=1.
+
+Only models.py is compiled: it is fully typed and its dataclasses gain
+C-level attribute access. The compiled module behaves the same as the
+interpreted one for the full settings round trip, including the pickle
+sidecar cache. manager.py stays interpreted since its dynamic handler
+binding and method-local attribute definitions are not valid under
+mypyc's strict checking.
+"""
+
+import os
+from setuptools import setup
+
+buildKwargs = {}
+
+if os.environ.get("NTT_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    buildKwargs["ext_modules"] = mypycify(["ntt_project_manager/models.py"])
+
+setup(**buildKwargs)